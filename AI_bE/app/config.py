@@ -22,15 +22,16 @@ TOPIC_KEYWORDS = [
     "entertainment", "movies", "cinema", "film", "bollywood", "kollywood", "celebrity", "series", "tv show"
 ]
 
-# Mapping for normalizing common state and city variations
-LOCATION_MAPPING = {
-    "tamilnadu": '"Tamil Nadu"', "tamil nadu": '"Tamil Nadu"', "tamil-nadu": '"Tamil Nadu"',
-    "delhi": "Delhi", "mumbai": "Mumbai", "chennai": "Chennai", "kolkata": "Kolkata",
-    "bangalore": "Bengaluru", "bengaluru": "Bengaluru", "kerala": "Kerala",
-    "punjab": "Punjab", "uttarpradesh": '"Uttar Pradesh"', "up": '"Uttar Pradesh"',
-    "maharashtra": "Maharashtra", "gujarat": "Gujarat", "andhrapradesh": '"Andhra Pradesh"',
-    "telangana": "Telangana", "odisha": "Odisha", "bihar": "Bihar", "india": "India"
-}
-
 # Ignore these in extracted locations
-SKIP_WORDS_IN_LOCATION = ["uh", "the", "a", "in", "at", "on", "from", "to", "of"]
+SKIP_WORDS_IN_LOCATION = [
+    "uh", "the", "a", "in", "at", "on", "from", "to", "of",
+    "city", "now", "today", "tomorrow", "please"
+]
+
+# Words that end a place name captured from free speech
+# ("weather in chennai right now", "hyderabad and bangalore")
+STOP_WORDS_AFTER_LOCATION = [
+    "and", "or", "right", "this", "next", "for", "like", "with", "during",
+    "is", "was", "will", "be", "going", "weekend", "tonight", "morning",
+    "afternoon", "evening", "week", "currently"
+]
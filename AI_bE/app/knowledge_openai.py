@@ -4,11 +4,14 @@ import httpx
 import json
 import os
 import re
+import time
 from dotenv import load_dotenv
 from openai import AsyncOpenAI
 import feedparser
 import wikipedia
 
+from app.locations import Location, resolve_leading_location, resolve_location, unresolved_location
+
 load_dotenv()
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
@@ -24,22 +27,33 @@ GOOGLE_CSE_ID = os.getenv("GOOGLE_CSE_ID")
 
 client = AsyncOpenAI(api_key=OPENAI_API_KEY)
 
-LOCATION_MAPPING = {
-    "delhi": "New Delhi",
-    "mumbai": "Mumbai",
-    "chennai": "Chennai",
-    "bangalore": "Bangalore",
-    "kolkata": "Kolkata",
-    "hyderabad": "Hyderabad",
-    "india": "India"
-}
+# Upstream weather/news responses, cached per resolved location ID.
+CACHE_TTL_SECONDS = 600
+CACHE_MAX_ENTRIES = 256
+_weather_cache = {}
+_news_cache = {}
+
+# Cached in place of a weather response when OpenWeather rejects a location,
+# so unknown names are not re-sent upstream until the entry expires.
+_WEATHER_LOOKUP_FAILED = object()
 
 
-def normalize_location(location: str) -> str:
-    if not location:
-        return "India"
-    key = location.lower().replace(" ", "").replace("-", "")
-    return LOCATION_MAPPING.get(key, location.title())
+def _cache_get(cache: dict, key):
+    entry = cache.get(key)
+    if entry and time.monotonic() - entry[0] < CACHE_TTL_SECONDS:
+        return entry[1]
+    return None
+
+
+def _cache_put(cache: dict, key, value):
+    now = time.monotonic()
+    for stale in [k for k, (stored, _) in cache.items() if now - stored >= CACHE_TTL_SECONDS]:
+        del cache[stale]
+    cache.pop(key, None)
+    # Entries are inserted in time order, so the first key is the oldest.
+    while len(cache) >= CACHE_MAX_ENTRIES:
+        del cache[next(iter(cache))]
+    cache[key] = (now, value)
 
 
 async def detect_info_needed(question: str) -> dict:
@@ -65,59 +79,75 @@ async def detect_info_needed(question: str) -> dict:
         return {"weather": False, "news": False, "location": "India", "topic": None}
 
 
-async def get_weather(city: str):
+async def get_weather(location: Location):
+    cached = _cache_get(_weather_cache, location.id)
+    if cached is _WEATHER_LOOKUP_FAILED:
+        raise LookupError(f"Weather lookup already failed for {location.name}")
+    if cached:
+        return cached
+    if location.lat is not None:
+        params = {"lat": location.lat, "lon": location.lon}
+    else:
+        params = {"q": location.name}
     async with httpx.AsyncClient() as http_client:
         res = await http_client.get(
             WEATHER_API_URL,
-            params={"q": city, "appid": OPENWEATHER_API_KEY, "units": "metric"}
+            params={**params, "appid": OPENWEATHER_API_KEY, "units": "metric"}
         )
+        if res.is_client_error:
+            _cache_put(_weather_cache, location.id, _WEATHER_LOOKUP_FAILED)
         res.raise_for_status()
-        return res.json()
+        weather = res.json()
+    _cache_put(_weather_cache, location.id, weather)
+    return weather
 
 
-async def get_weather_update(city: str):
+async def get_weather_update(location: Location):
     try:
-        weather = await get_weather(city)
+        weather = await get_weather(location)
         desc = weather['weather'][0]['description']
         temp = weather['main']['temp']
         hum = weather['main']['humidity']
         wind = weather['wind']['speed']
-        return f"The weather in {city} is {desc}, {temp}°C, humidity {hum}%, wind {wind} m/s."
+        return f"The weather in {location.name} is {desc}, {temp}°C, humidity {hum}%, wind {wind} m/s."
     except Exception as e:
         print("Weather error:", e)
-        return f"Could not get weather for {city}."
+        return f"Could not get weather for {location.name}."
 
 
-async def get_news(city: str, topic: str = None):
+async def get_news(location: Location, topic: str = None):
+    cache_key = (location.id, (topic or "").lower())
+    cached = _cache_get(_news_cache, cache_key)
+    if cached:
+        return cached
     try:
-        normalized = normalize_location(city)
-        query = f"{normalized} {topic}" if topic else normalized
+        query = f"{location.news_query} {topic}" if topic else location.news_query
         query = query.replace(" ", "+")
         rss_url = f"https://news.google.com/rss/search?q={query}&hl=en-IN&gl=IN&ceid=IN:en"
 
         feed = feedparser.parse(rss_url)
 
         if not feed.entries:
-            return f"No news found for {normalized} on topic '{topic}'." if topic else f"No general news found for {normalized}."
+            return f"No news found for {location.name} on topic '{topic}'." if topic else f"No general news found for {location.name}."
 
         summary = "\n".join([f"- {entry.title}" for entry in feed.entries[:5]])
-        return f"Top news in {normalized} ({topic or 'general'}):\n{summary}"
+        result = f"Top news in {location.name} ({topic or 'general'}):\n{summary}"
+        _cache_put(_news_cache, cache_key, result)
+        return result
     except Exception as e:
         print("News RSS error:", e)
-        return f"Could not retrieve news for {city}."
+        return f"Could not retrieve news for {location.name}."
 
 
-async def fetch_weather(session, query):
+async def fetch_weather(query):
     match = re.search(r'weather in ([a-zA-Z\s]+)', query, re.IGNORECASE)
     if not match:
         return None
-    city = match.group(1).strip()
-    url = f"https://api.openweathermap.org/data/2.5/weather?q={city}&appid={OPENWEATHER_API_KEY}&units=metric"
+    location = resolve_leading_location(match.group(1))
     try:
-        async with session.get(url) as response:
-            data = await response.json()
-            if "main" in data:
-                return f"The current weather in {city} is {data['weather'][0]['description']} with a temperature of {data['main']['temp']}°C."
+        data = await get_weather(location)
+        if "main" in data:
+            return f"The current weather in {location.name} is {data['weather'][0]['description']} with a temperature of {data['main']['temp']}°C."
     except:
         pass
     return None
@@ -172,7 +202,7 @@ async def fetch_google_cse(session, query):
 async def fetch_augmented_answer(query: str) -> str:
     async with aiohttp.ClientSession() as session:
         results = await asyncio.gather(
-            fetch_weather(session, query),
+            fetch_weather(query),
             fetch_news(session, query),
             fetch_duckduckgo(session, query),
             fetch_wikipedia_summary(query),
@@ -190,15 +220,16 @@ async def generate_openai_response_stream(user_question: str):
     try:
         info = await detect_info_needed(user_question)
 
-        city = normalize_location(info.get("location", "India"))
+        location_name = info.get("location") or "India"
+        location = resolve_location(location_name) or unresolved_location(location_name)
         topic = info.get("topic", None)
 
         info_parts = []
 
         if info.get("weather"):
-            info_parts.append(await get_weather_update(city))
+            info_parts.append(await get_weather_update(location))
         if info.get("news"):
-            info_parts.append(await get_news(city, topic))
+            info_parts.append(await get_news(location, topic))
 
         context_info = "\n\n".join(info_parts) or "No relevant data found."
 
@@ -0,0 +1,185 @@
+import json
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from app.config import SKIP_WORDS_IN_LOCATION, STOP_WORDS_AFTER_LOCATION
+
+GAZETTEER_PATH = Path(__file__).parent / "data" / "gazetteer.json"
+
+DEFAULT_LOCATION_ID = "in"
+
+# Fuzzy matching tuning: queries shorter than MIN_FUZZY_KEY_LENGTH and
+# gazetteer keys shorter than MIN_FUZZY_TARGET_LENGTH only match exactly
+# ("indonesia" must not become "india"), the shorter of query/key must be at
+# least MIN_FUZZY_LENGTH_RATIO of the longer ("west" vs "westbengal"), and
+# trigram similarity below FUZZY_MATCH_THRESHOLD is rejected.
+MIN_FUZZY_KEY_LENGTH = 4
+MIN_FUZZY_TARGET_LENGTH = 6
+MIN_FUZZY_LENGTH_RATIO = 0.8
+FUZZY_MATCH_THRESHOLD = 0.7
+
+# Longest run of words tried as a single place name ("andhra pradesh").
+MAX_PHRASE_WORDS = 3
+
+# Prefer the most specific place when several phrases match equally well.
+KIND_RANK = {"city": 2, "state": 1, "country": 0}
+
+
+@dataclass(frozen=True)
+class Location:
+    id: str
+    name: str
+    kind: str
+    state: Optional[str]
+    lat: Optional[float]
+    lon: Optional[float]
+
+    @property
+    def news_query(self) -> str:
+        """Search phrase for news lookups; multi-word names are quoted."""
+        return f'"{self.name}"' if " " in self.name else self.name
+
+
+# ----------------------------------------
+# Index building (runs once at import)
+# ----------------------------------------
+def _tokenize(text: str) -> list:
+    words = re.sub(r"[^a-z]+", " ", text.lower()).split()
+    return [w for w in words if w not in SKIP_WORDS_IN_LOCATION]
+
+
+def _trigrams(key: str) -> set:
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _load_gazetteer(path: Path = GAZETTEER_PATH) -> tuple:
+    with open(path, encoding="utf-8") as f:
+        entries = json.load(f)
+    return {
+        e["id"]: Location(e["id"], e["name"], e["kind"], e["state"], e["lat"], e["lon"])
+        for e in entries
+    }, {e["id"]: e.get("aliases", []) for e in entries}
+
+
+def _build_index(locations: dict, aliases: dict):
+    """Map compact names/aliases to location IDs and trigrams to those keys.
+
+    Only city/state keys of at least MIN_FUZZY_TARGET_LENGTH characters go
+    into the trigram index; everything else is reachable by exact match only.
+    """
+    key_to_id = {}
+    trigram_index = {}
+    for loc_id, loc in locations.items():
+        for name in [loc.name, *aliases[loc_id]]:
+            key = "".join(_tokenize(name))
+            if not key:
+                continue
+            key_to_id.setdefault(key, loc_id)
+            if loc.kind == "country" or len(key) < MIN_FUZZY_TARGET_LENGTH:
+                continue
+            for gram in _trigrams(key):
+                trigram_index.setdefault(gram, set()).add(key)
+    return key_to_id, {gram: frozenset(keys) for gram, keys in trigram_index.items()}
+
+
+LOCATIONS, _ALIASES = _load_gazetteer()
+_KEY_TO_ID, _TRIGRAM_INDEX = _build_index(LOCATIONS, _ALIASES)
+_KEY_TRIGRAMS = {key: _trigrams(key) for key in _KEY_TO_ID}
+
+
+# ----------------------------------------
+# Lookup
+# ----------------------------------------
+def _fuzzy_match(key: str):
+    """Best (score, key) by trigram Dice similarity, or None."""
+    if len(key) < MIN_FUZZY_KEY_LENGTH:
+        return None
+    grams = _trigrams(key)
+    candidates = set()
+    for gram in grams:
+        candidates |= _TRIGRAM_INDEX.get(gram, frozenset())
+
+    best = None
+    for candidate in candidates:
+        if min(len(key), len(candidate)) < MIN_FUZZY_LENGTH_RATIO * max(len(key), len(candidate)):
+            continue
+        other = _KEY_TRIGRAMS[candidate]
+        score = 2 * len(grams & other) / (len(grams) + len(other))
+        if score >= FUZZY_MATCH_THRESHOLD and (best is None or score > best[0]):
+            best = (score, candidate)
+    return best
+
+
+def _phrases(words: list):
+    """Yield (start, end, key) for contiguous runs of up to MAX_PHRASE_WORDS
+    words, longest first."""
+    for size in range(min(len(words), MAX_PHRASE_WORDS), 0, -1):
+        for start in range(len(words) - size + 1):
+            yield start, start + size, "".join(words[start:start + size])
+
+
+@lru_cache(maxsize=1024)
+def resolve_location(text: str) -> Optional[Location]:
+    """Resolve a free-form (possibly misheard) place name to a gazetteer entry.
+
+    Exact name/alias matches win; otherwise the closest trigram match above
+    FUZZY_MATCH_THRESHOLD is used. Every word must belong to some matching
+    phrase, so "Salem Oregon" is not taken to mean Salem, Tamil Nadu.
+    Empty input resolves to India; returns None if nothing is close enough.
+    """
+    words = _tokenize(text or "")
+    if not words:
+        return default_location()
+    best = None
+    covered = set()
+    for start, end, phrase in _phrases(words):
+        if phrase in _KEY_TO_ID:
+            match = (1.0, phrase)
+        else:
+            match = _fuzzy_match(phrase)
+        if not match:
+            continue
+        covered.update(range(start, end))
+        loc = LOCATIONS[_KEY_TO_ID[match[1]]]
+        rank = (match[0], KIND_RANK.get(loc.kind, 0))
+        if best is None or rank > best[0]:
+            best = (rank, loc)
+    if len(covered) < len(words):
+        return None
+    return best[1] if best else None
+
+
+def default_location() -> Location:
+    return LOCATIONS[DEFAULT_LOCATION_ID]
+
+
+def unresolved_location(text: str) -> Location:
+    """Stand-in for a place missing from the gazetteer, looked up by name.
+
+    The ID is derived from the normalized text, so upstream responses for
+    the same place are still cached under one key.
+    """
+    words = _tokenize(text or "")
+    return Location(f"raw:{'-'.join(words)}", " ".join(words).title(), "unresolved", None, None, None)
+
+
+def resolve_leading_location(text: str) -> Location:
+    """Resolve the place named at the start of free text, e.g. an STT capture.
+
+    The text is cut at the first STOP_WORDS_AFTER_LOCATION word, so "chennai
+    right now" resolves to Chennai rather than an unknown "Chennai Right".
+    Falls back to unresolved_location on the remaining words.
+    """
+    leading = []
+    for word in _tokenize(text or ""):
+        if word in STOP_WORDS_AFTER_LOCATION:
+            break
+        leading.append(word)
+    if not leading:
+        return default_location()
+    place = " ".join(leading)
+    return resolve_location(place) or unresolved_location(place)
@@ -0,0 +1 @@
+# Puts AI_bE on sys.path so tests can import `app` however pytest is run.
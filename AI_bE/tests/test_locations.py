@@ -0,0 +1,77 @@
+import pytest
+
+from app.locations import resolve_leading_location, resolve_location, unresolved_location
+
+
+def _resolved_id(text):
+    location = resolve_location(text)
+    return location.id if location else None
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Chennai", "in-tn-chennai"),
+    ("bombay", "in-mh-mumbai"),
+    ("tn", "in-tn"),
+    ("delhi", "in-dl-newdelhi"),
+    ("Tamil-Nadu", "in-tn"),
+    ("india", "in"),
+])
+def test_exact_names_and_aliases(text, expected):
+    assert _resolved_id(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("chenai", "in-tn-chennai"),
+    ("hydrabad", "in-tg-hyderabad"),
+    ("coimbator", "in-tn-coimbatore"),
+    ("tamil nadoo", "in-tn"),
+    ("kolkatta", "in-wb-kolkata"),
+])
+def test_misheard_spellings(text, expected):
+    assert _resolved_id(text) == expected
+
+
+def test_skip_words_are_ignored():
+    assert _resolved_id("uh in the city of chennai today") == "in-tn-chennai"
+
+
+@pytest.mark.parametrize("text", ["", None, "uh the"])
+def test_empty_input_defaults_to_india(text):
+    assert _resolved_id(text) == "in"
+
+
+def test_city_preferred_over_state():
+    assert _resolved_id("Chennai Tamil Nadu") == "in-tn-chennai"
+
+
+@pytest.mark.parametrize("text", [
+    "Indonesia",
+    "Indianapolis",
+    "Indiana",
+    "Salem Oregon",
+    "Hyderabad Pakistan",
+    "west",
+    "Uttara",
+    "London",
+])
+def test_unrelated_places_do_not_resolve(text):
+    assert resolve_location(text) is None
+
+
+def test_unresolved_location_keys_on_normalized_text():
+    location = unresolved_location("uh London")
+    assert location.id == unresolved_location("london").id == "raw:london"
+    assert location.name == "London"
+    assert location.lat is None
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("chennai right now", "in-tn-chennai"),
+    ("bangalore this weekend", "in-ka-bengaluru"),
+    ("Hyderabad and Bangalore", "in-tg-hyderabad"),
+    ("chenai tomorrow morning", "in-tn-chennai"),
+    ("london right now", "raw:london"),
+    ("Salem Oregon this week", "raw:salem-oregon"),
+])
+def test_leading_location_ignores_trailing_words(text, expected):
+    assert resolve_leading_location(text).id == expected